@@ -5,12 +5,19 @@ from scipy.special import gamma
 def clip_positions(positions, bounds):
     return np.clip(positions, bounds[:, 0], bounds[:, 1])
 
+def evaluate_population(obj_func, positions, batch_func=None):
+    # batch_func: optional vectorized objective taking a (pop, dim) array
+    if batch_func is not None:
+        return np.asarray(batch_func(positions), dtype=float)
+    return np.apply_along_axis(obj_func, 1, positions)
+
 # ---------------------- Genetic Algorithm ----------------------
 class GA:
     def __init__(self, obj_func, dim, bounds,
                  population_size=50, max_iter=100,
-                 crossover_rate=0.8, mutation_rate=0.1):
+                 crossover_rate=0.8, mutation_rate=0.1, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         # bounds: list of (low, high) tuples, length == dim
         self.bounds = np.array(bounds)               # shape (dim,2)
@@ -24,7 +31,7 @@ class GA:
         highs = self.bounds[:, 1]
         self.positions = np.random.uniform(lows, highs,
                                            size=(self.pop_size, self.dim))
-        self.fitness = np.apply_along_axis(self.obj_func, 1, self.positions)
+        self.fitness = evaluate_population(self.obj_func, self.positions, self.batch_func)
         self.history = [np.min(self.fitness)]
         self.best_y = self.history[0]
 
@@ -62,7 +69,7 @@ class GA:
                 if len(new_pop) < self.pop_size:
                     new_pop.append(self.mutate(c2))
             self.positions = np.array(new_pop)
-            self.fitness = np.apply_along_axis(self.obj_func, 1, self.positions)
+            self.fitness = evaluate_population(self.obj_func, self.positions, self.batch_func)
 
             current_best = np.min(self.fitness)
             self.history.append(current_best)
@@ -81,8 +88,9 @@ class GA:
 
 class GWWOA:
     def __init__(self, obj_func, dim, bounds, population_size=50, max_iter=100, 
-                 levy_prob=0.1, chaos_prob=0.1, beta=1.5):
+                 levy_prob=0.1, chaos_prob=0.1, beta=1.5, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
@@ -97,7 +105,7 @@ class GWWOA:
         for i in range(self.pop_size//2):
             self.positions[i] = self.logistic_map()
         
-        self.fitness = np.apply_along_axis(self.obj_func, 1, self.positions)
+        self.fitness = evaluate_population(self.obj_func, self.positions, self.batch_func)
         self.sort_population()
         self.alpha = self.positions[0]
         self.beta_wolf = self.positions[1]
@@ -187,8 +195,9 @@ class GWWOA:
 
 
 class WOA:
-    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100):
+    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
@@ -197,7 +206,7 @@ class WOA:
         # Initialize population
         self.positions = np.random.uniform(low=self.bounds[:,0], high=self.bounds[:,1], 
                                        size=(self.pop_size, self.dim))
-        self.fitness = np.apply_along_axis(self.obj_func, 1, self.positions)
+        self.fitness = evaluate_population(self.obj_func, self.positions, self.batch_func)
         self.best_idx = np.argmin(self.fitness)
         self.best_position = self.positions[self.best_idx]
         self.best_fitness = self.fitness[self.best_idx]
@@ -252,8 +261,9 @@ class WOA:
 
 class HS:  # Harmony Search
     def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100,
-                 hmcr=0.95, par=0.3, bandwidth=0.05):
+                 hmcr=0.95, par=0.3, bandwidth=0.05, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
@@ -265,7 +275,7 @@ class HS:  # Harmony Search
         # Initialize harmony memory
         self.harmony_memory = np.random.uniform(low=self.bounds[:,0], high=self.bounds[:,1], 
                                               size=(self.pop_size, self.dim))
-        self.fitness = np.apply_along_axis(self.obj_func, 1, self.harmony_memory)
+        self.fitness = evaluate_population(self.obj_func, self.harmony_memory, self.batch_func)
         self.best_idx = np.argmin(self.fitness)
         self.best_solution = self.harmony_memory[self.best_idx]
         self.best_fitness = self.fitness[self.best_idx]
@@ -304,8 +314,9 @@ class HS:  # Harmony Search
 
 class FPA:  # Flower Pollination Algorithm
     def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100,
-                 p=0.8, beta=1.5):
+                 p=0.8, beta=1.5, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
@@ -316,7 +327,7 @@ class FPA:  # Flower Pollination Algorithm
         # Initialize population
         self.positions = np.random.uniform(low=self.bounds[:,0], high=self.bounds[:,1], 
                                          size=(self.pop_size, self.dim))
-        self.fitness = np.apply_along_axis(self.obj_func, 1, self.positions)
+        self.fitness = evaluate_population(self.obj_func, self.positions, self.batch_func)
         self.best_idx = np.argmin(self.fitness)
         self.best_position = self.positions[self.best_idx]
         self.best_fitness = self.fitness[self.best_idx]
@@ -359,8 +370,9 @@ class FPA:  # Flower Pollination Algorithm
 # ---------------------- Particle Swarm Optimization ----------------------
 class PSO:
     def __init__(self, obj_func, dim, bounds, population_size=50, max_iter=100,
-                 inertia=0.7, c1=1.5, c2=1.5):
+                 inertia=0.7, c1=1.5, c2=1.5, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
@@ -374,7 +386,7 @@ class PSO:
         self.velocities = np.random.uniform(-v_range, v_range,
                                             size=(self.pop_size, self.dim))
         self.pbest_pos = self.positions.copy()
-        self.pbest_val = np.apply_along_axis(self.obj_func, 1, self.positions)
+        self.pbest_val = evaluate_population(self.obj_func, self.positions, self.batch_func)
         gidx = np.argmin(self.pbest_val)
         self.gbest_pos = self.pbest_pos[gidx].copy()
         self.gbest_val = self.pbest_val[gidx]
@@ -388,7 +400,7 @@ class PSO:
                                + self.c2*r2*(self.gbest_pos - self.positions))
             self.positions += self.velocities
             self.positions = clip_positions(self.positions, self.bounds)
-            fitness = np.apply_along_axis(self.obj_func, 1, self.positions)
+            fitness = evaluate_population(self.obj_func, self.positions, self.batch_func)
             mask = fitness < self.pbest_val
             self.pbest_pos[mask] = self.positions[mask]
             self.pbest_val[mask] = fitness[mask]
@@ -401,15 +413,16 @@ class PSO:
 
 # ---------------------- Grey Wolf Optimizer ----------------------
 class GWO:
-    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100):
+    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100, batch_func=None):
         self.obj = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
         self.max_iter = max_iter
         self.positions = np.random.uniform(self.bounds[:,0], self.bounds[:,1],
                                            size=(self.pop_size, self.dim))
-        self.fitness = np.apply_along_axis(self.obj,1,self.positions)
+        self.fitness = evaluate_population(self.obj, self.positions, self.batch_func)
         idx = np.argsort(self.fitness)
         self.alpha, self.beta_wolf, self.delta = [self.positions[i] for i in idx[:3]]
         self.history = [self.fitness[idx[0]]]
@@ -441,8 +454,9 @@ class GWO:
 # ---------------------- Cat Swarm Optimization ----------------------
 class CSO:
     def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100,
-                 mr=0.3, smp=5, c1=2.0):
+                 mr=0.3, smp=5, c1=2.0, batch_func=None):
         self.obj = obj_func; self.dim=dim; self.bounds=np.array(bounds)
+        self.batch_func = batch_func
         self.pop_size=population_size; self.max_iter=max_iter
         self.mr = mr  # mixture ratio
         self.smp = smp  # seeking memory pool
@@ -450,7 +464,7 @@ class CSO:
         self.positions = np.random.uniform(self.bounds[:,0], self.bounds[:,1],
                                            size=(self.pop_size,self.dim))
         self.velocities = np.zeros_like(self.positions)
-        self.fitness = np.apply_along_axis(self.obj,1,self.positions)
+        self.fitness = evaluate_population(self.obj, self.positions, self.batch_func)
         self.history=[np.min(self.fitness)]
 
     def optimize(self):
@@ -462,7 +476,7 @@ class CSO:
                     for j in range(self.smp):
                         idx = np.random.randint(0,self.dim)
                         candidates[j,idx] += np.random.randn()*0.1*(self.bounds[idx,1]-self.bounds[idx,0])
-                    c_fits = np.apply_along_axis(self.obj,1,candidates)
+                    c_fits = evaluate_population(self.obj, candidates, self.batch_func)
                     best = candidates[np.argmin(c_fits)]
                     self.positions[i]=clip_positions(best,self.bounds)
                 else:
@@ -478,12 +492,13 @@ class CSO:
 
 # ---------------------- Harris Hawks Optimization ----------------------
 class HHO:
-    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100):
+    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100, batch_func=None):
         self.obj=obj_func; self.dim=dim; self.bounds=np.array(bounds)
+        self.batch_func = batch_func
         self.pop_size=population_size; self.max_iter=max_iter
         self.positions=np.random.uniform(self.bounds[:,0], self.bounds[:,1],
                                          size=(self.pop_size,self.dim))
-        self.fitness=np.apply_along_axis(self.obj,1,self.positions)
+        self.fitness=evaluate_population(self.obj, self.positions, self.batch_func)
         self.history=[np.min(self.fitness)]
         self.best_idx=np.argmin(self.fitness)
         self.prey=self.positions[self.best_idx]
@@ -517,13 +532,14 @@ class HHO:
 # ---------------------- Bacterial Foraging Optimization ----------------------
 class BFO:
     def __init__(self, obj_func, dim, bounds, population_size=30, chem_steps=5,
-                 swim_length=4, repro_steps=2, elim_disp_steps=2, Ped=0.25):
+                 swim_length=4, repro_steps=2, elim_disp_steps=2, Ped=0.25, batch_func=None):
         self.obj=obj_func; self.dim=dim; self.bounds=np.array(bounds)
+        self.batch_func = batch_func
         self.pop_size=population_size; self.Cs=0.1
         self.S=swim_length; self.Nre=repro_steps; self.Ned=elim_disp_steps; self.Ped=Ped
         self.positions=np.random.uniform(self.bounds[:,0], self.bounds[:,1],
                                          size=(self.pop_size,self.dim))
-        self.history=[np.min(np.apply_along_axis(self.obj,1,self.positions))]
+        self.history=[np.min(evaluate_population(self.obj, self.positions, self.batch_func))]
 
     def optimize(self):
         for _ in range(self.Ned):
@@ -556,13 +572,14 @@ class BFO:
 # ---------------------- Fish School Search ----------------------
 class FSS:
     def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100,
-                 step_ind=0.1, step_vol=0.01):
+                 step_ind=0.1, step_vol=0.01, batch_func=None):
         self.obj, self.dim = obj_func, dim
+        self.batch_func = batch_func
         self.bounds = np.array(bounds); self.pop_size=population_size; self.max_iter=max_iter
         self.step_ind, self.step_vol = step_ind, step_vol
         self.positions = np.random.uniform(self.bounds[:,0], self.bounds[:,1],
                                          size=(self.pop_size,self.dim))
-        self.fitness = np.apply_along_axis(self.obj,1,self.positions)
+        self.fitness = evaluate_population(self.obj, self.positions, self.batch_func)
         self.vol = np.ones(self.dim)
         self.history=[np.min(self.fitness)]
 
@@ -600,12 +617,13 @@ class FSS:
 
 # ---------------------- Moth-Flame Optimization ----------------------
 class MFO:
-    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100):
+    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100, batch_func=None):
         self.obj, self.dim = obj_func, dim
+        self.batch_func = batch_func
         self.bounds = np.array(bounds); self.pop_size=population_size; self.max_iter=max_iter
         self.moths = np.random.uniform(self.bounds[:,0], self.bounds[:,1],
                                        size=(self.pop_size, self.dim))
-        self.fits = np.apply_along_axis(self.obj,1,self.moths)
+        self.fits = evaluate_population(self.obj, self.moths, self.batch_func)
         self.flames = self.moths.copy(); self.flame_fits = self.fits.copy()
         self.history=[np.min(self.fits)]
 
@@ -629,8 +647,9 @@ class MFO:
         return self.moths[0], self.history
 
 class MayflyAlgorithm:
-    def __init__(self, obj_func, dim, bounds, population_size=40, max_iter=100, alpha=0.5, beta=0.5, delta=0.1, gamma=1.0):
+    def __init__(self, obj_func, dim, bounds, population_size=40, max_iter=100, alpha=0.5, beta=0.5, delta=0.1, gamma=1.0, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
@@ -643,8 +662,8 @@ class MayflyAlgorithm:
         self.female = np.random.uniform(self.bounds[:,0], self.bounds[:,1], (self.pop_size//2, self.dim))
         self.male_v = np.zeros_like(self.male)
         self.female_v = np.zeros_like(self.female)
-        self.male_f = np.apply_along_axis(self.obj_func, 1, self.male)
-        self.female_f = np.apply_along_axis(self.obj_func, 1, self.female)
+        self.male_f = evaluate_population(self.obj_func, self.male, self.batch_func)
+        self.female_f = evaluate_population(self.obj_func, self.female, self.batch_func)
         self.best = self.male[np.argmin(self.male_f)]
         self.best_f = np.min(self.male_f)
         self.history = [self.best_f]
@@ -655,14 +674,14 @@ class MayflyAlgorithm:
                 attract = self.alpha * (self.best - self.male[i])
                 self.male_v[i] = self.beta * self.male_v[i] + attract + self.delta * np.random.randn(self.dim)
                 self.male[i] = np.clip(self.male[i] + self.male_v[i], self.bounds[:,0], self.bounds[:,1])
-            self.male_f = np.apply_along_axis(self.obj_func, 1, self.male)
+            self.male_f = evaluate_population(self.obj_func, self.male, self.batch_func)
             # update female velocities & positions
             male_best = self.male[np.argmin(self.male_f)]
             for i in range(len(self.female)):
                 attract = self.gamma * (male_best - self.female[i])
                 self.female_v[i] = self.beta * self.female_v[i] + attract + self.delta * np.random.randn(self.dim)
                 self.female[i] = np.clip(self.female[i] + self.female_v[i], self.bounds[:,0], self.bounds[:,1])
-            self.female_f = np.apply_along_axis(self.obj_func, 1, self.female)
+            self.female_f = evaluate_population(self.obj_func, self.female, self.batch_func)
             # mating (crossover)
             idx_m = np.argsort(self.male_f)
             idx_f = np.argsort(self.female_f)
@@ -681,8 +700,9 @@ class MayflyAlgorithm:
 
 #-----------------Pufferfish Optimization Algorithm (PFA)-------------------------------------
 class PFA:
-    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100, a=0.2, b=1.5, c=1.5):
+    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100, a=0.2, b=1.5, c=1.5, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
@@ -691,7 +711,7 @@ class PFA:
         self.b = b
         self.c = c
         self.positions = np.random.uniform(self.bounds[:,0], self.bounds[:,1], (self.pop_size, self.dim))
-        self.fitness = np.apply_along_axis(self.obj_func, 1, self.positions)
+        self.fitness = evaluate_population(self.obj_func, self.positions, self.batch_func)
         self.best_idx = np.argmin(self.fitness)
         self.best = self.positions[self.best_idx]
         self.best_f = self.fitness[self.best_idx]
@@ -721,14 +741,15 @@ class PFA:
 
 #-----------------------Hippopotamus Optimization Algorithm (HOA)-------------------------------------
 class HOA:
-    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100):
+    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
         self.max_iter = max_iter
         self.positions = np.random.uniform(self.bounds[:,0], self.bounds[:,1], (self.pop_size, self.dim))
-        self.fitness = np.apply_along_axis(self.obj_func, 1, self.positions)
+        self.fitness = evaluate_population(self.obj_func, self.positions, self.batch_func)
         self.best_idx = np.argmin(self.fitness)
         self.best = self.positions[self.best_idx]
         self.best_f = self.fitness[self.best_idx]
@@ -757,8 +778,9 @@ class HOA:
         return self.best, self.history
 #---------------------Arctic Puffin Optimization (APO)---------------------------
 class APO:
-    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100, alpha=1.5, beta=0.1):
+    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100, alpha=1.5, beta=0.1, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
@@ -766,7 +788,7 @@ class APO:
         self.alpha = alpha
         self.beta = beta
         self.positions = np.random.uniform(self.bounds[:,0], self.bounds[:,1], (self.pop_size, self.dim))
-        self.fitness = np.apply_along_axis(self.obj_func, 1, self.positions)
+        self.fitness = evaluate_population(self.obj_func, self.positions, self.batch_func)
         self.best_idx = np.argmin(self.fitness)
         self.best = self.positions[self.best_idx]
         self.best_f = self.fitness[self.best_idx]
@@ -791,14 +813,15 @@ class APO:
     
 #-----------------------Tiki-Taka Algorithm (TTA)-----------------------------------------
 class TTA:
-    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100):
+    def __init__(self, obj_func, dim, bounds, population_size=30, max_iter=100, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.dim = dim
         self.bounds = np.array(bounds)
         self.pop_size = population_size
         self.max_iter = max_iter
         self.positions = np.random.uniform(self.bounds[:,0], self.bounds[:,1], (self.pop_size, self.dim))
-        self.fitness = np.apply_along_axis(self.obj_func, 1, self.positions)
+        self.fitness = evaluate_population(self.obj_func, self.positions, self.batch_func)
         self.best_idx = np.argmin(self.fitness)
         self.best = self.positions[self.best_idx]
         self.best_f = self.fitness[self.best_idx]
@@ -826,8 +849,9 @@ class TTA:
 #-----------------------Constrained Particle Swarm Optimization (CPSO)--------------------------------
 class CPSO:
     def __init__(self, obj_func, dim, bounds, constraints, penalty=1e6,
-                 population_size=50, max_iter=100, inertia=0.7, c1=1.5, c2=1.5):
+                 population_size=50, max_iter=100, inertia=0.7, c1=1.5, c2=1.5, batch_func=None):
         self.obj_func = obj_func
+        self.batch_func = batch_func
         self.constraints = constraints  # list of constraint functions, each returns True if feasible
         self.penalty = penalty
         self.dim = dim
@@ -843,7 +867,7 @@ class CPSO:
         self.velocities = np.random.uniform(-v_range, v_range,
                                             size=(self.pop_size, self.dim))
         self.pbest_pos = self.positions.copy()
-        self.pbest_val = np.apply_along_axis(self._penalized_obj, 1, self.positions)
+        self.pbest_val = evaluate_population(self._penalized_obj, self.positions, self._penalized_batch)
         gidx = np.argmin(self.pbest_val)
         self.gbest_pos = self.pbest_pos[gidx].copy()
         self.gbest_val = self.pbest_val[gidx]
@@ -853,6 +877,11 @@ class CPSO:
             return self.obj_func(x)
         else:
             return self.obj_func(x) + self.penalty
+    def _penalized_batch(self, X):
+        if self.batch_func is None:
+            return evaluate_population(self._penalized_obj, X)
+        feasible = np.array([all(con(x) for con in self.constraints) for x in X])
+        return self.batch_func(X) + self.penalty * ~feasible
     def optimize(self):
         for _ in range(self.max_iter):
             r1, r2 = np.random.rand(self.pop_size, self.dim), np.random.rand(self.pop_size, self.dim)
@@ -861,7 +890,7 @@ class CPSO:
                                + self.c2*r2*(self.gbest_pos - self.positions))
             self.positions += self.velocities
             self.positions = clip_positions(self.positions, self.bounds)
-            fitness = np.apply_along_axis(self._penalized_obj, 1, self.positions)
+            fitness = evaluate_population(self._penalized_obj, self.positions, self._penalized_batch)
             mask = fitness < self.pbest_val
             self.pbest_pos[mask] = self.positions[mask]
             self.pbest_val[mask] = fitness[mask]
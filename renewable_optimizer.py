@@ -1,14 +1,153 @@
+import math
+import warnings
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from scipy.optimize import minimize
-from scipy.special import gamma
 from algorithms import GA, GWWOA, WOA, HS, FPA, PSO, GWO, CSO, HHO, BFO, FSS, MFO
 from algorithms import MayflyAlgorithm, PFA, HOA, APO, TTA, CPSO
 
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # numba yoksa çekirdekler saf Python olarak çalışır
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(
+    "f8(f8, f8[:], f4[:], f4[:], f4[:], i1[:], i1[:], f8[:], f8, f8, f8, f8, f8, f8)",
+    cache=True,
+    fastmath=True,
+)
+def _energy_cost_nb(
+    S,
+    u,
+    P_gen,
+    P_demand,
+    grid_price,
+    emergency,
+    grid_available,
+    decay,
+    capital_cost,
+    charge_eff,
+    discharge_eff,
+    SOC_min,
+    SOC_max,
+    carbon_rate,
+):
+    """Tek bir çözüm için toplam maliyet (RenewableOptimizer.energy_cost)."""
+    hours = u.shape[0]
+    total_cost = np.float64(capital_cost * S)  # veriler float32, toplam float64
+    SOC = 0.5
+    SOC_prev1 = SOC_prev2 = 0.0
+    temperature = 25.0
+    dispatched = 0.0
+
+    for t_i in range(hours):
+        effective_S = S * decay[t_i]
+        P_bess = u[t_i] * effective_S
+        P_grid = P_demand[t_i] - P_gen[t_i] - P_bess
+        dispatched += u[t_i] * S
+
+        # Acil durum yükü (dalsız: maske ile çarpılır)
+        required_power = P_demand[t_i] * 1.5
+        shortage = max(0.0, required_power - (P_gen[t_i] + P_bess)) * emergency[t_i]
+        total_cost += shortage * 1000
+
+        # Şebeke kısıtları
+        total_cost += 1e6 * (1 - grid_available[t_i]) * (P_grid > 0)
+
+        # Maliyetler
+        grid_cost = grid_price[t_i] * max(P_grid, 0.0)
+        degradation = 0.02 * math.pow(math.fabs(P_bess), 1.5) * (1 + SOC / 0.9)
+        carbon_cost = P_grid * carbon_rate
+        total_cost += grid_cost + degradation + carbon_cost
+
+        # Termal model
+        temperature += math.fabs(P_bess / effective_S) / 0.05
+        overheat = max(0.0, temperature - 45)
+        total_cost += overheat * overheat * 10
+
+        # SOC güncelleme
+        delta_charge = (-P_bess * charge_eff) / effective_S
+        delta_discharge = -P_bess / (discharge_eff * effective_S)
+        delta = delta_charge if P_bess < 0 else delta_discharge
+        SOC += delta
+        SOC = SOC_min if SOC < SOC_min else (SOC_max if SOC > SOC_max else SOC)
+
+        # SOC zincirleme kısıt: son üç SOC değerinin ortalaması
+        avg_soc = (SOC_prev2 + SOC_prev1 + SOC) / 3
+        total_cost += 1e4 * (t_i >= 3) * (math.fabs(SOC - avg_soc) > 0.2)
+        SOC_prev2 = SOC_prev1
+        SOC_prev1 = SOC
+
+    # Verimlilik hedefi
+    efficiency = (np.sum(P_gen) + dispatched) / np.sum(P_demand)
+    total_cost += max(0.0, 0.85 - efficiency) * 1e4
+
+    # Periyodik maliyet
+    total_cost += 100 * math.fabs(math.sin(S * 0.01))
+
+    return total_cost
+
+
+# energy_cost için denemeye özgü veriler; süreçlere gönderilebilir (picklable)
+CostContext = namedtuple(
+    "CostContext",
+    [
+        "P_gen",
+        "P_demand",
+        "grid_price",
+        "emergency_event",
+        "grid_available",
+        "decay",
+        "capital_cost",
+        "charge_eff",
+        "discharge_eff",
+        "SOC_min",
+        "SOC_max",
+        "carbon_rate",
+    ],
+)
+
+
+def _eval(sol, ctx):
+    return _energy_cost_nb(sol[0], sol[1:], *ctx)
+
+
+def _eval_chunk(X, ctx):
+    return np.array([_eval(sol, ctx) for sol in X])
+
+
+@njit("f8[:](f8[:], f8, f8, f8)", cache=True)
+def _soc_clip(delta, lo, hi, init):
+    """Her adımda [lo, hi] aralığına kırpılan kümülatif SOC toplamı."""
+    SOC = np.empty(delta.shape[0])
+    s = init
+    for t in range(delta.shape[0]):
+        s += delta[t]
+        s = lo if s < lo else (hi if s > hi else s)
+        SOC[t] = s
+    return SOC
+
 
 class RenewableOptimizer:
-    def __init__(self, hours=24, population=30, max_iter=50):
+    BOUNDS = np.array([[1, 2000]] + [[-0.5, 0.5]] * 24)  # [S, u_0..u_23]
+    # energy_cost önbelleğindeki en fazla çözüm; 0 = kapalı. Derlenmiş
+    # çekirdekle anahtar oluşturmak değerlendirmenin kendisinden pahalı
+    # ve isabetler yalnızca aynı anahtara yuvarlanan başka bir çözümün
+    # maliyetini döndürür, bu yüzden varsayılan olarak kapalı
+    cache_size = 0
+    cache_decimals = 4  # önbellek anahtarı için yuvarlama hassasiyeti
+    carbon_rate = 0.487 * 2  # şebeke karbon maliyeti katsayısı
+
+    def __init__(self, hours=24, population=30, max_iter=50, n_jobs=1):
         self.hours = hours
         self.pop_size = population
         self.max_iter = max_iter
@@ -21,11 +160,31 @@ class RenewableOptimizer:
         self.SOC_min, self.SOC_max = 0.1, 0.9
         self.data_variation = 0.15  # %15 rastgele varyasyon
         self.temperature = 25
-        self.SOC_capacity_decay = [1.0 - 0.005 * i for i in range(24)]
-        self.emergency_event = np.zeros(24)
+        self.SOC_capacity_decay = np.array([1.0 - 0.005 * i for i in range(24)])
+        self.emergency_event = np.zeros(24, dtype=np.int8)
+
+        # Popülasyon değerlendirmesi için isteğe bağlı süreç havuzu. Tek
+        # değerlendirme birkaç µs sürdüğünden mevcut maliyet fonksiyonunda
+        # parça başına loky aktarımı işin kendisinden pahalıdır; n_jobs=1
+        # (varsayılan) daha hızlıdır
+        self.n_jobs = n_jobs
+        self._parallel = None
+        if n_jobs != 1:
+            from joblib import Parallel
+
+            self._parallel = Parallel(n_jobs=n_jobs, backend="loky")
+
+        # Popülasyonu tek bir bitişik (pop, 25) float64 tampona toplamak için
+        self._buf = np.empty((self.pop_size, self.hours + 1))
+
+        # energy_cost önbelleği (LRU); değerler deneme verisine bağlı
+        self._cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def load_data(self, trial_num):
-        np.random.seed(trial_num)
+        self.clear_cache()
+        rng = np.random.default_rng(trial_num)
         t = np.arange(self.hours)
 
         # Temel veri oluşturma
@@ -35,132 +194,195 @@ class RenewableOptimizer:
         base_price = 0.15 + 0.05 * np.sin(np.pi * (t - 8) / 12) + 0.05
 
         # Varyasyon ve kesintiler
-        variation = 1 + self.data_variation * np.random.randn(self.hours)
-        self.solar_failure = np.random.choice([0, 1], 24, p=[0.9, 0.1])
-        self.wind_failure = np.random.choice([0, 1], 24, p=[0.85, 0.15])
-        self.grid_available = np.random.choice([0, 1], 24, p=[0.2, 0.8])
-        self.emergency_event = np.random.choice([0, 1], 24, p=[0.9, 0.1])
-
-        # Üretim ve talep
-        self.P_solar = np.clip(base_solar * variation * self.solar_failure, 0, None)
-        self.P_wind = np.clip(base_wind * variation * self.wind_failure, 0, None)
+        variation = 1 + self.data_variation * rng.standard_normal(self.hours)
+        self.solar_failure = rng.choice([0, 1], 24, p=[0.9, 0.1]).astype(np.int8)
+        self.wind_failure = rng.choice([0, 1], 24, p=[0.85, 0.15]).astype(np.int8)
+        self.grid_available = rng.choice([0, 1], 24, p=[0.2, 0.8]).astype(np.int8)
+        self.emergency_event = rng.choice([0, 1], 24, p=[0.9, 0.1]).astype(np.int8)
+
+        # energy_cost_batch için önceden hesaplanan maskeler
+        self.grid_off = self.grid_available == 0
+        self.emergency_multiplier = (1 + 0.5 * self.emergency_event).astype(np.float32)
+
+        # Üretim ve talep (float32: 1e-3 üzerinde hassasiyet gerekmiyor)
+        self.P_solar = np.clip(base_solar * variation * self.solar_failure, 0, None).astype(np.float32)
+        self.P_wind = np.clip(base_wind * variation * self.wind_failure, 0, None).astype(np.float32)
         self.P_gen = self.P_solar + self.P_wind
-        self.P_demand = base_demand * variation * np.random.normal(1, 0.15, 24)
+        self.P_demand = (base_demand * variation * rng.normal(1, 0.15, 24)).astype(np.float32)
 
         # Fiyatlandırma ve spike'lar
-        self.grid_price = np.clip(base_price * variation, 0.05, None)
-        spike_hours = np.random.choice(24, size=4, replace=False)
-        self.grid_price[spike_hours] *= np.random.uniform(3, 5, size=4)
+        grid_price = np.clip(base_price * variation, 0.05, None)
+        spike_hours = rng.choice(24, size=4, replace=False)
+        grid_price[spike_hours] *= rng.uniform(3, 5, size=4)
+        self.grid_price = grid_price.astype(np.float32)
+
+    def cost_context(self):
+        return CostContext(
+            self.P_gen,
+            self.P_demand,
+            self.grid_price,
+            self.emergency_event,
+            self.grid_available,
+            self.SOC_capacity_decay,
+            self.capital_cost,
+            self.charge_eff,
+            self.discharge_eff,
+            self.SOC_min,
+            self.SOC_max,
+            self.carbon_rate,
+        )
 
     def energy_cost(self, solution):
-        S = solution[0]
-        u = solution[1:]
+        if not self.cache_size:
+            return _eval(solution, self.cost_context())
+
+        key = np.round(solution, self.cache_decimals).tobytes()
+        if key in self._cache:
+            self.cache_hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        self.cache_misses += 1
+        cost = _eval(solution, self.cost_context())
+        self._cache[key] = cost
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return cost
+
+    def clear_cache(self):
+        self._cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cache_hit_ratio(self):
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    def energy_cost_batch(self, X):
+        """Vectorized energy_cost over a (pop, 25) array of solutions."""
+        X = np.atleast_2d(X)
+        S = X[:, 0]
+        u = X[:, 1:]
+        decay = self.SOC_capacity_decay
+        demand = self.P_demand
+        gen = self.P_gen
+        price = self.grid_price
+        grid_off = self.grid_off
+        em = self.emergency_event
         total_cost = self.capital_cost * S
-        SOC = 0.5
-        SOC_history = []
-        self.temperature = 25
 
+        effective_S = S[:, None] * decay[None, :]
+        P_bess = u * effective_S
+        P_grid = demand - gen - P_bess
+
+        # Acil durum yükü
+        required_power = demand * self.emergency_multiplier
+        shortage = np.maximum(0, required_power - (gen + P_bess)) * em
+        total_cost += 1000 * shortage.sum(axis=1)
+
+        # Şebeke kısıtları
+        total_cost += 1e6 * (grid_off & (P_grid > 0)).sum(axis=1)
+
+        # SOC güncelleme: saatlik clip yola bağımlı, bu yüzden döngü
+        # saatler üzerinde, tüm popülasyon tek vektör olarak ilerler
+        delta_charge = (-P_bess * self.charge_eff) / effective_S
+        delta_discharge = -P_bess / (self.discharge_eff * effective_S)
+        delta = np.where(P_bess < 0, delta_charge, delta_discharge)
+        # Sütun 0 başlangıç SOC'si; saat t öncesi/sonrası SOC aynı tampondan
+        # kopyasız görünümler olarak okunur
+        SOC_track = np.empty((len(X), self.hours + 1))
+        SOC_track[:, 0] = 0.5
         for t_i in range(self.hours):
-            effective_S = S * self.SOC_capacity_decay[t_i]
-            P_bess = u[t_i] * effective_S
-            P_grid = self.P_demand[t_i] - self.P_gen[t_i] - P_bess
-
-            # Acil durum yükü
-            if self.emergency_event[t_i]:
-                required_power = self.P_demand[t_i] * 1.5
-                shortage = max(0, required_power - (self.P_gen[t_i] + P_bess))
-                total_cost += shortage * 1000
-
-            # Şebeke kısıtları
-            if not self.grid_available[t_i] and P_grid > 0:
-                total_cost += 1e6
-
-            # Maliyetler
-            grid_cost = P_grid * self.grid_price[t_i] if P_grid > 0 else 0
-            degradation = 0.02 * (abs(P_bess) ** 1.5) * (1 + SOC / 0.9)
-            carbon_cost = P_grid * 0.487 * 2
-            total_cost += grid_cost + degradation + carbon_cost
-
-            # Termal model
-            delta_temp = abs(P_bess / effective_S) / 0.05
-            self.temperature += delta_temp
-            if self.temperature > 45:
-                total_cost += (self.temperature - 45) ** 2 * 10
-
-            # SOC güncelleme
-            if P_bess < 0:
-                delta = (-P_bess * self.charge_eff) / effective_S
-            else:
-                delta = -P_bess / (self.discharge_eff * effective_S)
-            SOC += delta
-            SOC = np.clip(SOC, self.SOC_min, self.SOC_max)
-            SOC_history.append(SOC)
-
-            # SOC zincirleme kısıt
-            if t_i >= 3:
-                avg_soc = np.mean(SOC_history[-3:])
-                if abs(SOC - avg_soc) > 0.2:
-                    total_cost += 1e4
+            SOC_track[:, t_i + 1] = np.clip(
+                SOC_track[:, t_i] + delta[:, t_i], self.SOC_min, self.SOC_max
+            )
+        SOC_before = SOC_track[:, :-1]
+        SOC_history = SOC_track[:, 1:]
+
+        # Maliyetler
+        grid_cost = price * np.maximum(P_grid, 0)
+        degradation = 0.02 * (np.abs(P_bess) ** 1.5) * (1 + SOC_before / 0.9)
+        carbon_cost = P_grid * self.carbon_rate
+        total_cost += (grid_cost + degradation + carbon_cost).sum(axis=1)
+
+        # Termal model
+        temperature = 25 + np.cumsum(np.abs(P_bess / effective_S) / 0.05, axis=1)
+        total_cost += (np.maximum(0, temperature - 45) ** 2 * 10).sum(axis=1)
+
+        # SOC zincirleme kısıt
+        avg_soc = (SOC_history[:, 1:-2] + SOC_history[:, 2:-1] + SOC_history[:, 3:]) / 3
+        chain_violation = np.abs(SOC_history[:, 3:] - avg_soc) > 0.2
+        total_cost += 1e4 * chain_violation.sum(axis=1)
 
         # Verimlilik hedefi
-        efficiency = (sum(self.P_gen) + sum(u * S)) / sum(self.P_demand)
-        if efficiency < 0.85:
-            total_cost += (0.85 - efficiency) * 1e4
+        efficiency = (np.sum(gen) + np.sum(u * S[:, None], axis=1)) / np.sum(demand)
+        total_cost += np.maximum(0, 0.85 - efficiency) * 1e4
 
         # Periyodik maliyet
-        total_cost += 100 * abs(np.sin(S * 0.01))
+        total_cost += 100 * np.abs(np.sin(S * 0.01))
 
         return total_cost
-    
-    def run_ga(self):
-        """Genetic Algorithm implementation with callback history."""
-        # Alt ve üst sınırlarınızı önce tanımlayın:
-        lb = [1.0] + [-0.5] * 24
-        ub = [2000.0] + [0.5] * 24
-        bounds = list(zip(lb, ub))  # [(1.0,2000.0), (-0.5,0.5), …]
 
+    def _as_batch(self, pop):
+        """Return pop as one C-contiguous (pop, 25) float64 array."""
+        if (
+            isinstance(pop, np.ndarray)
+            and pop.dtype == np.float64
+            and pop.flags.c_contiguous
+        ):
+            return pop
+        if len(pop) == len(self._buf):
+            return np.stack(pop, axis=0, out=self._buf)
+        return np.ascontiguousarray(pop, dtype=np.float64)
+
+    def evaluate_population(self, X):
+        """Evaluate a (pop, 25) population, in parallel when n_jobs != 1.
+
+        The parallel path is slower than the serial one for the current cost
+        function: dispatching chunks to loky (~ms) dwarfs the few µs each
+        evaluation takes. It only pays off for a much more expensive model.
+        """
+        X = self._as_batch(X)
+        if self._parallel is None:
+            # Derlenmiş çekirdek satır satır NumPy toplu sürümünden hızlı;
+            # numba yoksa vektörel energy_cost_batch kullanılır
+            if HAVE_NUMBA:
+                return _eval_chunk(X, self.cost_context())
+            return self.energy_cost_batch(X)
+        from joblib import delayed, effective_n_jobs
+
+        ctx = self.cost_context()
+        chunks = np.array_split(X, min(len(X), effective_n_jobs(self.n_jobs)))
+        costs = self._parallel(delayed(_eval_chunk)(chunk, ctx) for chunk in chunks)
+        return np.concatenate(costs)
+
+    def run_ga(self):
+        """Genetic Algorithm implementation"""
         ga = GA(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter,
             crossover_rate=0.8,
             mutation_rate=0.1,
         )
 
-        # Callback sınıfı
-        class GACallback:
-            def __init__(self):
-                self.history = []
-
-            def register(self, ga_instance):
-                self.ga = ga_instance
-
-            def update(self):
-                # ga.best_y en güncel en iyi fitness
-                self.history.append(self.ga.best_y)
-
-        callback = GACallback()
-        ga.callback = callback
-        callback.register(ga)
-
-        # GA'yı çalıştır
+        # GA'yı tek seferde çalıştır; GA her nesilde en iyi değeri zaten
+        # history'ye ekliyor. İlk eleman başlangıç popülasyonuna ait.
         best_x, history = ga.run()
 
-        # Eğer callback hiçbir güncelleme yapmadıysa yine de final değeri ekle
-        if not callback.history:
-            callback.history.append(history[-1])
-
-        return best_x, callback.history
+        # Hiç nesil çalışmadıysa yine de final değeri döndür
+        return best_x, history[1:] or history[-1:]
 
     def run_gwwoa(self):
         """GW-WOA Algorithm implementation"""
-        bounds = [[1, 2000]] + [[-0.5, 0.5]] * 24
         gwwoa = GWWOA(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter,
             levy_prob=0.1,
@@ -172,11 +394,11 @@ class RenewableOptimizer:
     
     def run_woa(self):
         """Whale Optimization Algorithm implementation"""
-        bounds = [[1, 2000]] + [[-0.5, 0.5]] * 24
         woa = WOA(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter,
         )
@@ -185,11 +407,11 @@ class RenewableOptimizer:
     
     def run_hs(self):
         """Harmony Search implementation"""
-        bounds = [[1, 2000]] + [[-0.5, 0.5]] * 24
         hs = HS(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter,
             hmcr=0.95,
@@ -201,11 +423,11 @@ class RenewableOptimizer:
     
     def run_fpa(self):
         """Flower Pollination Algorithm implementation"""
-        bounds = [[1, 2000]] + [[-0.5, 0.5]] * 24
         fpa = FPA(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter,
             p=0.8,
@@ -216,16 +438,12 @@ class RenewableOptimizer:
 
     def run_pso(self):
         """Particle Swarm Optimization implementation"""
-        # Alt/üst sınırlar
-        lb = [1.0] + [-0.5] * 24
-        ub = [2000.0] + [0.5] * 24
-        bounds = list(zip(lb, ub))  # [(1.0,2000.0), (-0.5,0.5), ...]
-
         # PSO nesnesi
         pso = PSO(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter,
             inertia=0.7,
@@ -239,16 +457,12 @@ class RenewableOptimizer:
 
     def run_gwo(self):
         """Grey Wolf Optimizer implementation"""
-        # Alt ve üst sınırlar
-        lb = [1.0] + [-0.5] * 24
-        ub = [2000.0] + [0.5] * 24
-        bounds = list(zip(lb, ub))  # [(1.0,2000.0), (-0.5,0.5), ...]
-
         # GWO nesnesini oluştur
         gwo = GWO(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter
         )
@@ -259,16 +473,12 @@ class RenewableOptimizer:
 
     def run_cso(self):
         """Cat Swarm Optimization implementation"""
-        # Alt/üst sınırlar
-        lb = [1.0] + [-0.5] * 24
-        ub = [2000.0] + [0.5] * 24
-        bounds = list(zip(lb, ub))  # [(1.0,2000.0), (-0.5,0.5), ...]
-
         # CSO nesnesi
         cso = CSO(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter,
             mr=0.3,
@@ -282,16 +492,12 @@ class RenewableOptimizer:
 
     def run_hho(self):
         """Harris Hawks Optimization implementation"""
-        # Alt/üst sınırlar
-        lb = [1.0] + [-0.5] * 24
-        ub = [2000.0] + [0.5] * 24
-        bounds = list(zip(lb, ub))  # [(1.0,2000.0), (-0.5,0.5), ...]
-
         # HHO nesnesini oluştur
         hho = HHO(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter
         )
@@ -302,16 +508,12 @@ class RenewableOptimizer:
     
     def run_bfo(self):
         """Bacterial Foraging Optimization implementation"""
-        # Alt/üst sınırlar
-        lb = [1.0] + [-0.5] * 24
-        ub = [2000.0] + [0.5] * 24
-        bounds = list(zip(lb, ub))  # [(1.0,2000.0), (-0.5,0.5), ...]
-
         # BFO nesnesi: chem_steps olarak self.max_iter kullanıyoruz
         bfo = BFO(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             chem_steps=self.max_iter,
             # Diğer parametreler için varsayılan değerleri kullanıyoruz:
@@ -324,16 +526,12 @@ class RenewableOptimizer:
    
     def run_fss(self):
         """Fish School Search implementation"""
-        # Alt/üst sınırlar
-        lb = [1.0] + [-0.5] * 24
-        ub = [2000.0] + [0.5] * 24
-        bounds = list(zip(lb, ub))  # [(1.0,2000.0), (-0.5,0.5), ...]
-
         # FSS nesnesi
         fss = FSS(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter,
             step_ind=0.1,
@@ -347,16 +545,12 @@ class RenewableOptimizer:
 
     def run_mfo(self):
         """Moth-Flame Optimization implementation"""
-        # Alt/üst sınırlar
-        lb = [1.0] + [-0.5] * 24
-        ub = [2000.0] + [0.5] * 24
-        bounds = list(zip(lb, ub))  # [(1.0,2000.0), (-0.5,0.5), ...]
-
         # MFO nesnesi
         mfo = MFO(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter
         )
@@ -366,11 +560,11 @@ class RenewableOptimizer:
         return best_x, history
     
     def run_pfa(self):
-        bounds = [[1, 2000]] + [[-0.5, 0.5]] * 24
         algo = PFA(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter
         )
@@ -378,11 +572,11 @@ class RenewableOptimizer:
         return best_solution, fitness_history
     
     def run_hoa(self):
-        bounds = [[1, 2000]] + [[-0.5, 0.5]] * 24
         algo = HOA(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter
         )
@@ -390,11 +584,11 @@ class RenewableOptimizer:
         return best_solution, fitness_history
     
     def run_apo(self):
-        bounds = [[1, 2000]] + [[-0.5, 0.5]] * 24
         algo = APO(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter
         )
@@ -402,11 +596,11 @@ class RenewableOptimizer:
         return best_solution, fitness_history
     
     def run_tta(self):
-        bounds = [[1, 2000]] + [[-0.5, 0.5]] * 24
         algo = TTA(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter
         )
@@ -414,11 +608,11 @@ class RenewableOptimizer:
         return best_solution, fitness_history
     
     def run_mayfly(self):
-        bounds = [[1, 2000]] + [[-0.5, 0.5]] * 24
         algo = MayflyAlgorithm(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             population_size=self.pop_size,
             max_iter=self.max_iter
         )
@@ -426,7 +620,6 @@ class RenewableOptimizer:
         return best_solution, fitness_history
         
     def run_cpso(self):
-        bounds = [[1, 2000]] + [[-0.5, 0.5]] * 24
         # Burada basit constraint: S>0, tüm u in [-0.5, 0.5] kalmalı
         constraints = [
             lambda x: x[0] > 0,            # Battery capacity
@@ -434,9 +627,10 @@ class RenewableOptimizer:
             lambda x: np.all(x[1:] <= 0.5)
         ]
         algo = CPSO(
-            obj_func=lambda x: self.energy_cost(x),
+            obj_func=self.energy_cost,
+            batch_func=self.evaluate_population,
             dim=25,
-            bounds=bounds,
+            bounds=self.BOUNDS,
             constraints=constraints,
             population_size=self.pop_size,
             max_iter=self.max_iter
@@ -447,23 +641,20 @@ class RenewableOptimizer:
 def calculate_soc(solution, hours=24):
     """Calculate SOC time series from solution"""
     S = solution[0]
-    u = solution[1:]
+    u = np.asarray(solution[1:], dtype=float)
+    P_bess = u[1:hours] * S
+    delta = np.where(P_bess < 0, (-P_bess * 0.95) / S, -P_bess / (0.95 * S))
+
     SOC = np.zeros(hours)
     SOC[0] = 0.5
-
-    for t in range(1, hours):
-        P_bess = u[t] * S
-        if P_bess < 0:  # Charging
-            delta = (-P_bess * 0.95) / S
-        else:  # Discharging
-            delta = -P_bess / (0.95 * S)
-        SOC[t] = SOC[t - 1] + delta
-        SOC[t] = np.clip(SOC[t], 0.1, 0.9)
+    SOC[1:] = _soc_clip(delta, 0.1, 0.9, SOC[0])
 
     return SOC
 
 
 def plot_convergence(results):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 8))
     for algo, data in results.items():
         plt.plot(data["history"], label=algo)
@@ -478,6 +669,8 @@ def plot_convergence(results):
 
 # Analiz ve görselleştirme fonksiyonları
 def plot_convergence(results):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 8))
     for algo, data in results.items():
         if len(data["histories"]) > 0:
@@ -492,6 +685,8 @@ def plot_convergence(results):
 
 
 def plot_soc_comparison(results):
+    import matplotlib.pyplot as plt
+
     algorithms = list(results.keys())
     num_algorithms = len(algorithms)
 
@@ -536,11 +731,14 @@ def plot_soc_comparison(results):
 
 
 def population_sensitivity():
+    import matplotlib.pyplot as plt
+
     populations = [20, 30, 50, 70]
     results = {}
 
     for pop in populations:
         optimizer = RenewableOptimizer(population=pop)
+        np.random.seed(0)
         optimizer.load_data(0)  # Load data with trial=0
         _, cost_history = optimizer.run_gwwoa()
         results[pop] = cost_history[-1]
@@ -555,32 +753,67 @@ def population_sensitivity():
     plt.close()
 
 
-def run_multiple_trials(optimizer_class, algorithms, num_trials=100):
+def _run_one_trial(trial, optimizer_class, algorithms):
+    np.random.seed(trial)  # Algorithms draw from the global RNG
+    optimizer = optimizer_class()  # Create a new instance for each trial
+    optimizer.load_data(trial)  # Load data for this trial
+
+    trial_results = {}
+    for name, method_name in algorithms.items():
+        try:
+            # Get the method by name from the current optimizer instance
+            method = getattr(optimizer, method_name)
+            best_x, history = method()
+            trial_results[name] = {
+                "cost": history[-1] if history else np.inf,
+                "history": history,
+                "solution": best_x,
+            }
+        except Exception as e:
+            print(f"{name} failed: {str(e)}")
+            trial_results[name] = {"cost": np.inf, "history": [], "solution": None}
+
+    hit_ratio = optimizer.cache_hit_ratio() if optimizer.cache_size else None
+    return trial_results, hit_ratio
+
+
+def run_multiple_trials(optimizer_class, algorithms, num_trials=100, max_workers=1):
+    """Denemeleri çalıştırır; isteğe bağlı olarak süreçlere dağıtır.
+
+    max_workers=1 (varsayılan) denemeleri bu süreçte sırayla çalıştırır.
+    Başka bir değer ProcessPoolExecutor kullanır (None = tüm çekirdekler);
+    bu durumda optimizer_class picklable olmalıdır, yani modül düzeyinde
+    tanımlı bir sınıf (lambda veya yerel sınıf değil). Popülasyon içi
+    paralellik (n_jobs) ile birlikte kullanılmamalıdır.
+    """
     results = {
         name: {"costs": [], "histories": [], "solutions": []}
         for name in algorithms.keys()
     }
 
-    for trial in range(num_trials):
-        print(f"\nTrial {trial+1}/{num_trials}")
-        optimizer = optimizer_class()  # Create a new instance for each trial
-        optimizer.load_data(trial)  # Load data for this trial
-
-        trial_results = {}
-        for name, method_name in algorithms.items():
-            try:
-                # Get the method by name from the current optimizer instance
-                method = getattr(optimizer, method_name)
-                best_x, history = method()
-                trial_results[name] = {
-                    "cost": history[-1] if history else np.inf,
-                    "history": history,
-                    "solution": best_x,
-                }
-            except Exception as e:
-                print(f"{name} failed: {str(e)}")
-                trial_results[name] = {"cost": np.inf, "history": [], "solution": None}
+    def report(trial, hit_ratio, done):
+        print(f"\nTrial {trial+1} finished ({done}/{num_trials})")
+        if hit_ratio is not None:
+            print(f"Cache hit ratio: {hit_ratio:.1%}")
+
+    trial_outputs = [None] * num_trials
+    if max_workers == 1:
+        for trial in range(num_trials):
+            trial_outputs[trial] = _run_one_trial(trial, optimizer_class, algorithms)
+            report(trial, trial_outputs[trial][1], trial + 1)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_run_one_trial, trial, optimizer_class, algorithms): trial
+                for trial in range(num_trials)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                trial = futures[future]
+                trial_outputs[trial] = future.result()
+                report(trial, trial_outputs[trial][1], done)
 
+    # Sonuçlar tamamlanma sırasına değil deneme sırasına göre birleştirilir
+    for trial_results, _ in trial_outputs:
         for name, data in trial_results.items():
             results[name]["costs"].append(data["cost"])
             results[name]["histories"].append(data["history"])
@@ -591,46 +824,58 @@ def run_multiple_trials(optimizer_class, algorithms, num_trials=100):
 
 def analyze_results(results):
     """Sonuçların istatistiksel analizi"""
-    analysis = {}
-
-    for algo, data in results.items():
-        costs = np.array(data["costs"])
-        valid_trials = costs[np.isfinite(costs)]
-
-        if len(valid_trials) == 0:
-            analysis[algo] = {
-                "mean": np.nan,
-                "std": np.nan,
-                "min": np.nan,
-                "max": np.nan,
-                "success_rate": 0.0,
-            }
-            continue
+    algo_names = list(results.keys())
+    if not algo_names:
+        return {}
 
-        analysis[algo] = {
-            "mean": np.mean(valid_trials),
-            "std": np.std(valid_trials),
-            "min": np.min(valid_trials),
-            "max": np.max(valid_trials),
-            "success_rate": len(valid_trials) / len(costs),
+    # (n_algos, n_trials) matris; başarısız denemeler NaN olarak dışlanır
+    costs_mat = np.stack(
+        [np.asarray(results[algo]["costs"], dtype=float) for algo in algo_names]
+    )
+    valid = np.isfinite(costs_mat)
+    valid_costs = np.where(valid, costs_mat, np.nan)
+
+    with warnings.catch_warnings():
+        # Hiç geçerli denemesi olmayan algoritmalar NaN alır
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        mean = np.nanmean(valid_costs, axis=1)
+        std = np.nanstd(valid_costs, axis=1)
+        min_ = np.nanmin(valid_costs, axis=1)
+        max_ = np.nanmax(valid_costs, axis=1)
+    n_trials = costs_mat.shape[1]
+    success_rate = valid.sum(axis=1) / n_trials if n_trials else np.zeros(len(algo_names))
+
+    return {
+        algo: {
+            "mean": mean[i],
+            "std": std[i],
+            "min": min_[i],
+            "max": max_[i],
+            "success_rate": success_rate[i],
         }
-
-    return analysis
+        for i, algo in enumerate(algo_names)
+    }
 
 
 def plot_mean_convergence(results, analysis):
     """Ortalama yakınsama eğrilerini çizdirme"""
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 8))
 
     for algo, data in results.items():
         if analysis[algo]["success_rate"] == 0:
             continue
 
-        # Tarihçeleri aynı uzunluğa getirme
-        max_length = max(len(h) for h in data["histories"])
-        padded_histories = [
-            h + [h[-1]] * (max_length - len(h)) for h in data["histories"]
-        ]
+        # Tarihçeleri aynı uzunluğa getirme: kısa olanlar son değerle,
+        # başarısız (boş) denemeler NaN ile doldurulur
+        histories = data["histories"]
+        max_length = max(len(h) for h in histories)
+        padded_histories = np.full((len(histories), max_length), np.nan)
+        for i, h in enumerate(histories):
+            if len(h):
+                padded_histories[i, : len(h)] = h
+                padded_histories[i, len(h) :] = h[-1]
 
         mean_history = np.nanmean(padded_histories, axis=0)
         std_history = np.nanstd(padded_histories, axis=0)
@@ -667,7 +912,9 @@ if __name__ == "__main__":
         "TTA": "run_tta",
         "CPSO": "run_cpso"
     }
-    results = run_multiple_trials(RenewableOptimizer, algorithms, num_trials=100)
+    results = run_multiple_trials(
+        RenewableOptimizer, algorithms, num_trials=100, max_workers=None
+    )
     analysis = analyze_results(results)
 
     print("\n=== Final Performance Summary ===")